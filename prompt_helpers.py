@@ -69,7 +69,56 @@ Enter the number of your choice:
 """,
     
     # Custom user prompt
-    "custom": "{message}"
+    "custom": "{message}",
+    
+    # Git-related prompts
+    "git_commit_message": """
+Enter a commit message for your changes:
+""",
+    
+    "git_create_branch": """
+Enter a name for the new branch:
+""",
+    
+    "git_select_branch": """
+Select a branch from the list:
+{branch_list}
+
+Enter the number of your choice:
+""",
+    
+    "git_confirm_push": """
+⚠️ You are about to push changes to remote repository.
+Do you want to continue? (yes/no)
+""",
+    
+    "git_confirm_reset": """
+⚠️ WARNING: You are about to reset the following files:
+{files}
+
+This will discard all changes since the last commit.
+Do you want to continue? (yes/no)
+""",
+    
+    "git_confirm_stash": """
+Do you want to include a message with your stash? (yes/no)
+""",
+    
+    "git_stash_message": """
+Enter a message for your stash:
+""",
+    
+    "git_clone_url": """
+Enter the URL of the git repository you want to clone:
+""",
+    
+    "git_remote_add": """
+Enter a name for the remote (e.g., origin):
+""",
+    
+    "git_remote_url": """
+Enter the URL for the remote repository:
+"""
 }
 
 # Helper functions
@@ -90,3 +139,10 @@ def format_file_list(files):
     for i, file in enumerate(files, 1):
         result += f"{i}. {file}\n"
     return result
+
+def format_branch_list(branches):
+    """Format a list of git branches for display in a prompt."""
+    result = ""
+    for i, branch in enumerate(branches, 1):
+        result += f"{i}. {branch}\n"
+    return result
@@ -1,47 +1,68 @@
 #!/usr/bin/env python3
 import os
+import re
 import sys
+import asyncio
+import contextlib
 import subprocess
 import signal
 import json
+import shlex
 import shutil
 import stat
-import glob
-from typing import Dict, List, Optional, Any, Union
+import tarfile
+import fcntl
+import functools
+import gzip
+import io
+import itertools
+import time
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 from fastmcp import FastMCP
 
 # Import git tools
 from git_tools import (
     git_clone, git_init, git_add, git_commit, git_status, git_push, git_pull,
-    git_log, git_checkout, git_branch, git_merge, git_show, git_diff, git_remote,
+    git_log, git_checkout, git_branch, git_branch_batch, git_merge, git_show, git_show_many, git_diff, git_remote,
     git_rev_parse, git_ls_files, git_describe, git_rebase, git_stash, git_reset,
     git_clean, git_tag, git_config, git_fetch, git_blame, git_grep, git_context,
     git_head, git_version, git_validate, git_repo_info, git_summarize_log,
-    git_suggest_commit, git_audit_history
+    git_suggest_commit, git_audit_history, warm_up_repository
 )
 
+# Log lines go out as they are completed; no per-print flush is needed
+sys.stderr.reconfigure(line_buffering=True)
+
+# Per-call debug logging is off unless FASTFS_DEBUG=1
+_DEBUG = os.environ.get("FASTFS_DEBUG") == "1"
+
 # Print startup message
-print("[fastfs-mcp] Server starting...", file=sys.stderr, flush=True)
+print("[fastfs-mcp] Server starting...", file=sys.stderr)
 
 # Set the default workspace directory to the parent directory
 WORKSPACE_DIR = "/mnt/workspace"
 if os.path.exists(WORKSPACE_DIR):
     os.chdir(WORKSPACE_DIR)
-    print(f"[fastfs-mcp] Working directory set to {WORKSPACE_DIR}", file=sys.stderr, flush=True)
+    print(f"[fastfs-mcp] Working directory set to {WORKSPACE_DIR}", file=sys.stderr)
 else:
     current_dir = os.getcwd()
-    print(f"[fastfs-mcp] Warning: {WORKSPACE_DIR} not found, using current directory: {current_dir}", file=sys.stderr, flush=True)
+    print(f"[fastfs-mcp] Warning: {WORKSPACE_DIR} not found, using current directory: {current_dir}", file=sys.stderr)
 
 # Initialize the MCP server
 mcp = FastMCP(name="fastfs-mcp")
 
-def run_command(cmd: str, input_text: Optional[str] = None) -> str:
-    """Execute a shell command and return its output."""
+def run_command(cmd: Union[str, List[str]], input_text: Optional[str] = None) -> str:
+    """Execute a command and return its output. A list is run directly as argv; a string goes through the shell."""
     try:
-        print(f"[DEBUG] Running command: {cmd}", file=sys.stderr, flush=True)
+        use_shell = isinstance(cmd, str)
+        if _DEBUG:
+            print(f"[DEBUG] Running command: {cmd if use_shell else shlex.join(cmd)}", file=sys.stderr)
         result = subprocess.run(
             cmd, 
-            shell=True, 
+            shell=use_shell, 
             capture_output=True, 
             text=True, 
             input=input_text
@@ -49,12 +70,94 @@ def run_command(cmd: str, input_text: Optional[str] = None) -> str:
         if result.returncode == 0:
             return result.stdout.strip()
         else:
-            print(f"[ERROR] Command failed: {result.stderr}", file=sys.stderr, flush=True)
+            print(f"[ERROR] Command failed: {result.stderr}", file=sys.stderr)
             return f"Error: {result.stderr.strip()}"
     except Exception as e:
-        print(f"[ERROR] Exception running command: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] Exception running command: {str(e)}", file=sys.stderr)
         return f"Exception: {str(e)}"
 
+# Recently confirmed regular files, keyed by absolute path. Agents tend to run
+# several tools on the same file in a row (cat, wc, head, ...), so a short TTL
+# saves repeated stat calls. Only positive results are cached, and tools that
+# modify the filesystem clear the cache.
+try:
+    _STAT_CACHE_TTL = float(os.environ.get("FASTFS_STAT_TTL", "1"))
+except ValueError:
+    _STAT_CACHE_TTL = 1.0
+_STAT_CACHE_MAX_ENTRIES = 4096
+_stat_cache: "OrderedDict[str, float]" = OrderedDict()
+
+def _invalidate_stat_cache() -> None:
+    """Forget all cached file checks after the filesystem was modified."""
+    _stat_cache.clear()
+
+def _iter_entries(root: str) -> Iterator[os.DirEntry]:
+    """
+    Yield every entry below a directory. Entry types come from the directory
+    listing itself (d_type), so no entry needs its own stat call.
+    """
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                yield entry
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+
+def _open_read(path: str, mode: str = 'rb'):
+    """
+    Open a file for reading without updating its access time when the
+    filesystem allows it (O_NOATIME needs the caller to own the file).
+    """
+    flags = os.O_RDONLY | getattr(os, "O_NOATIME", 0)
+    try:
+        fd = os.open(path, flags)
+    except PermissionError:
+        fd = os.open(path, os.O_RDONLY)
+    if 'b' in mode:
+        return os.fdopen(fd, mode)
+    return os.fdopen(fd, mode, encoding='utf-8')
+
+def _check_file(path: str) -> Optional[str]:
+    """Stat a path once and return why it is not a readable regular file, or None if it is."""
+    key = os.path.abspath(path)
+    checked_at = _stat_cache.get(key)
+    now = time.monotonic()
+    if checked_at is not None and now - checked_at < _STAT_CACHE_TTL:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        _stat_cache.pop(key, None)
+        return f"File '{path}' does not exist"
+    if not stat.S_ISREG(st.st_mode):
+        _stat_cache.pop(key, None)
+        return f"'{path}' is not a file"
+    if _STAT_CACHE_TTL > 0:
+        _stat_cache[key] = now
+        _stat_cache.move_to_end(key)
+        if len(_stat_cache) > _STAT_CACHE_MAX_ENTRIES:
+            _stat_cache.popitem(last=False)
+    return None
+
+# ioctl request that asks the filesystem for a copy-on-write clone (reflink)
+_FICLONE = 0x40049409
+
+def _copy_file(source: str, destination: str) -> str:
+    """Copy a file like shutil.copy2, cloning the data blocks when the filesystem allows it."""
+    if os.path.isdir(destination):
+        destination = os.path.join(destination, os.path.basename(source))
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        raise shutil.SameFileError(f"'{source}' and '{destination}' are the same file")
+    try:
+        with open(source, 'rb') as src, open(destination, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        shutil.copystat(source, destination)
+        return destination
+    except OSError:
+        # Not supported here (ext4, tmpfs, cross-device, ...); do a regular copy
+        return shutil.copy2(source, destination)
+
 # Define tool schemas with proper typing and input validation
 @mcp.tool(
     description="""List files and directories at a given path.
@@ -69,12 +172,13 @@ Example: ls(".") or ls("src/components")""",
 def fastfs_ls(path: str = ".") -> List[str]:
     """List files and directories at a given path."""
     try:
-        print(f"[DEBUG] ls called with path: {path}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] ls called with path: {path}", file=sys.stderr)
         if not os.path.exists(path):
             return [f"Error: Path '{path}' does not exist. Try pwd() to check current directory, or tree() to visualize structure. Paths are relative to /mnt/workspace."]
         return os.listdir(path)
     except Exception as e:
-        print(f"[ERROR] ls failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] ls failed: {str(e)}", file=sys.stderr)
         return [f"Error: {str(e)}"]
 
 @mcp.tool(
@@ -90,10 +194,11 @@ Example: pwd()""",
 def fastfs_pwd() -> str:
     """Print the current working directory."""
     try:
-        print(f"[DEBUG] pwd called", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] pwd called", file=sys.stderr)
         return os.getcwd()
     except Exception as e:
-        print(f"[ERROR] pwd failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] pwd failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="""Change the current working directory.
@@ -103,19 +208,24 @@ Prefer over: Using absolute paths repeatedly. Note: Changes persist across tool
 
 Returns: Confirmation with new absolute path.
 Example: cd("my-project") or cd("/mnt/workspace/src")""")
-def fastfs_cd(path: str) -> str:
+async def fastfs_cd(path: str) -> str:
     """Change the current working directory."""
     try:
-        print(f"[DEBUG] cd called with path: {path}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] cd called with path: {path}", file=sys.stderr)
         if not os.path.exists(path):
             return f"Error: Path '{path}' does not exist. Try ls() to see available directories, or find(pattern='*', file_type='d') to search for directories."
         if not os.path.isdir(path):
             return f"Error: '{path}' is not a directory. It appears to be a file. Use read() to view its contents instead."
 
-        os.chdir(path)
+        # Let queued and running git tools finish in the directory they were
+        # called from
+        async with _git_tools_idle:
+            await _git_tools_idle.wait_for(lambda: _git_tools_in_flight == 0)
+            os.chdir(path)
         return f"Changed directory to {os.getcwd()}"
     except Exception as e:
-        print(f"[ERROR] cd failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] cd failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(
@@ -131,17 +241,18 @@ Example: read("src/main.py") or read("config.json")""",
 def fastfs_read(path: str) -> str:
     """Read the contents of a file."""
     try:
-        print(f"[DEBUG] read called with path: {path}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] read called with path: {path}", file=sys.stderr)
         if not os.path.exists(path):
             return f"Error: File '{path}' does not exist. Try find(pattern='*{os.path.basename(path)}*') to locate it, or ls() to see files in current directory."
         if not os.path.isfile(path):
             return f"Error: '{path}' is not a file, it's a directory. Use ls('{path}') to list its contents, or tree('{path}') to see its structure."
-        with open(path, 'r', encoding='utf-8') as f:
+        with _open_read(path, 'r') as f:
             return f.read()
     except UnicodeDecodeError:
         return f"Error: '{path}' appears to be a binary file and cannot be read as text. Use stat('{path}') to check file info."
     except Exception as e:
-        print(f"[ERROR] read failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] read failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(
@@ -158,22 +269,31 @@ Example: write("output.txt", "Hello World") or write("src/new_module.py", "# New
 def fastfs_write(path: str, content: str = "") -> str:
     """Write contents to a file."""
     try:
-        print(f"[DEBUG] write called with path: {path}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] write called with path: {path}", file=sys.stderr)
+        _invalidate_stat_cache()
         existed = os.path.exists(path)
         # Create directory if it doesn't exist
         directory = os.path.dirname(path)
         if directory and not os.path.exists(directory):
             os.makedirs(directory)
 
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Encode once and hand the whole buffer to the kernel in a single write
+        data = content.encode('utf-8')
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
         if existed:
-            return f"Successfully overwrote {path} ({len(content)} bytes)"
-        return f"Successfully created {path} ({len(content)} bytes)"
+            return f"Successfully overwrote {path} ({len(data)} bytes)"
+        return f"Successfully created {path} ({len(data)} bytes)"
     except PermissionError:
         return f"Error: Permission denied writing to '{path}'. Check file permissions with stat('{path}') or verify mount permissions."
     except Exception as e:
-        print(f"[ERROR] write failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] write failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(
@@ -193,10 +313,7 @@ def fastfs_grep(pattern: str, path: str) -> str:
     if not os.path.isfile(path):
         return f"Error: '{path}' is not a file. For directory-wide search, use: find(path='{path}', pattern='*') then grep each result, or git_grep() for git repos."
 
-    # Escape the pattern to avoid shell injection
-    escaped_pattern = pattern.replace("'", "'\\''")
-    cmd = f"grep -n '{escaped_pattern}' {path}"
-    result = run_command(cmd)
+    result = run_command(["grep", "-n", "-e", pattern, "--", path])
 
     if not result:
         return f"No matches found for pattern '{pattern}' in '{path}'. Try a broader pattern or check spelling. For regex, escape special chars."
@@ -205,9 +322,7 @@ def fastfs_grep(pattern: str, path: str) -> str:
 @mcp.tool(description="Locate a command in the system path.")
 def fastfs_which(command: str) -> str:
     """Locate a command in the system path."""
-    # Escape the command to avoid shell injection
-    escaped_command = command.replace("'", "'\\''")
-    result = run_command(f"which '{escaped_command}'")
+    result = run_command(["which", command])
     
     if not result or "not found" in result.lower():
         return f"Command '{command}' not found in PATH"
@@ -216,15 +331,11 @@ def fastfs_which(command: str) -> str:
 @mcp.tool(description="Use sed to transform file content using stream editing.")
 def fastfs_sed(script: str, path: str) -> str:
     """Use sed to transform file content using stream editing."""
-    if not os.path.exists(path):
-        return f"Error: File '{path}' does not exist"
-    if not os.path.isfile(path):
-        return f"Error: '{path}' is not a file"
+    error = _check_file(path)
+    if error:
+        return f"Error: {error}"
     
-    # Escape the script to avoid shell injection
-    escaped_script = script.replace("'", "'\\''")
-    cmd = f"sed '{escaped_script}' {path}"
-    result = run_command(cmd)
+    result = run_command(["sed", "-e", script, "--", path])
     
     if not result:
         return f"No output from sed command with script '{script}' on file '{path}'"
@@ -233,15 +344,11 @@ def fastfs_sed(script: str, path: str) -> str:
 @mcp.tool(description="Use gawk to process file content using AWK scripting.")
 def fastfs_gawk(script: str, path: str) -> str:
     """Use gawk to process file content using AWK scripting."""
-    if not os.path.exists(path):
-        return f"Error: File '{path}' does not exist"
-    if not os.path.isfile(path):
-        return f"Error: '{path}' is not a file"
+    error = _check_file(path)
+    if error:
+        return f"Error: {error}"
     
-    # Escape the script to avoid shell injection
-    escaped_script = script.replace("'", "'\\''")
-    cmd = f"gawk '{escaped_script}' {path}"
-    result = run_command(cmd)
+    result = run_command(["gawk", "--", script, path])
     
     if not result:
         return f"No output from gawk command with script '{script}' on file '{path}'"
@@ -253,7 +360,8 @@ def fastfs_gawk(script: str, path: str) -> str:
 def fastfs_stat(path: str) -> Dict[str, Any]:
     """Display file status and metadata."""
     try:
-        print(f"[DEBUG] stat called with path: {path}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] stat called with path: {path}", file=sys.stderr)
         if not os.path.exists(path):
             return {"error": f"Path '{path}' does not exist"}
         
@@ -277,7 +385,7 @@ def fastfs_stat(path: str) -> Dict[str, Any]:
         }
         return result
     except Exception as e:
-        print(f"[ERROR] stat failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] stat failed: {str(e)}", file=sys.stderr)
         return {"error": str(e)}
 
 @mcp.tool(description="""Display directory tree structure with visual hierarchy.
@@ -290,20 +398,18 @@ Example: tree(".") or tree("src", depth=2) for shallow view""")
 def fastfs_tree(path: str = ".", depth: int = 3) -> str:
     """Display directory tree structure."""
     try:
-        print(f"[DEBUG] tree called with path: {path}, depth: {depth}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] tree called with path: {path}, depth: {depth}", file=sys.stderr)
         if not os.path.exists(path):
             return f"Error: Path '{path}' does not exist. Try pwd() to check current location, or ls() to see available directories."
 
-        # Escape path for shell command
-        escaped_path = path.replace("'", "'\\''")
-        cmd = f"tree -L {depth} '{escaped_path}'"
-        result = run_command(cmd)
+        result = run_command(["tree", "-L", str(depth), "--", path])
 
         if not result:
             return f"Directory '{path}' appears to be empty. Use ls('{path}') to confirm."
         return result
     except Exception as e:
-        print(f"[ERROR] tree failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] tree failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="""Find files by name pattern recursively.
@@ -321,7 +427,8 @@ Example: find(pattern="*.py") or find(path="src", pattern="*.test.js", file_type
 def fastfs_find(path: str = ".", pattern: str = "*", file_type: str = None, max_depth: int = None) -> List[str]:
     """Find files by pattern and other criteria."""
     try:
-        print(f"[DEBUG] find called with path: {path}, pattern: {pattern}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] find called with path: {path}, pattern: {pattern}", file=sys.stderr)
         if not os.path.exists(path):
             return [f"Error: Path '{path}' does not exist. Try pwd() to check current directory."]
 
@@ -336,15 +443,13 @@ def fastfs_find(path: str = ".", pattern: str = "*", file_type: str = None, max_
                 return [f"Error: Invalid file_type '{file_type}'. Valid options: 'f' (file), 'd' (directory), 'l' (symlink)"]
         cmd_parts.extend(["-name", pattern])
 
-        # Join and escape the command
-        cmd = " ".join(f"'{p}'" if ' ' in p else p for p in cmd_parts)
-        result = run_command(cmd)
+        result = run_command(cmd_parts)
 
         if not result:
             return [f"No files found matching pattern '{pattern}' in '{path}'. Try a broader pattern like '*{pattern.strip('*')}*' or check the path."]
         return result.split('\n')
     except Exception as e:
-        print(f"[ERROR] find failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] find failed: {str(e)}", file=sys.stderr)
         return [f"Error: {str(e)}"]
 
 @mcp.tool(description="""Copy files or directories.
@@ -361,7 +466,9 @@ Example: cp("config.json", "config.backup.json") or cp("template/", "new-project
 def fastfs_cp(source: str, destination: str, recursive: bool = False) -> str:
     """Copy files or directories."""
     try:
-        print(f"[DEBUG] cp called with source: {source}, destination: {destination}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] cp called with source: {source}, destination: {destination}", file=sys.stderr)
+        _invalidate_stat_cache()
         if not os.path.exists(source):
             return f"Error: Source '{source}' does not exist. Try find(pattern='*{os.path.basename(source)}*') to locate it."
 
@@ -370,16 +477,16 @@ def fastfs_cp(source: str, destination: str, recursive: bool = False) -> str:
 
         if os.path.exists(destination):
             dest_info = "directory" if os.path.isdir(destination) else "file"
-            print(f"[WARNING] Destination '{destination}' exists ({dest_info}), will overwrite", file=sys.stderr, flush=True)
+            print(f"[WARNING] Destination '{destination}' exists ({dest_info}), will overwrite", file=sys.stderr)
 
         if recursive:
-            shutil.copytree(source, destination, dirs_exist_ok=True)
+            shutil.copytree(source, destination, dirs_exist_ok=True, copy_function=_copy_file)
             return f"Successfully copied directory '{source}' to '{destination}'"
         else:
-            shutil.copy2(source, destination)
+            _copy_file(source, destination)
             return f"Successfully copied file '{source}' to '{destination}'"
     except Exception as e:
-        print(f"[ERROR] cp failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] cp failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="""Move or rename files or directories.
@@ -393,7 +500,9 @@ Example: mv("old_name.py", "new_name.py") or mv("src/utils", "lib/utils")""")
 def fastfs_mv(source: str, destination: str) -> str:
     """Move or rename files or directories."""
     try:
-        print(f"[DEBUG] mv called with source: {source}, destination: {destination}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] mv called with source: {source}, destination: {destination}", file=sys.stderr)
+        _invalidate_stat_cache()
         if not os.path.exists(source):
             return f"Error: Source '{source}' does not exist. Try find(pattern='*{os.path.basename(source)}*') to locate it."
 
@@ -403,7 +512,7 @@ def fastfs_mv(source: str, destination: str) -> str:
         shutil.move(source, destination)
         return f"Successfully moved '{source}' to '{destination}'"
     except Exception as e:
-        print(f"[ERROR] mv failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] mv failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(
@@ -424,7 +533,9 @@ Example: rm("temp.txt") or rm("node_modules", recursive=True)""",
 def fastfs_rm(path: str, recursive: bool = False, force: bool = False) -> str:
     """Remove files or directories."""
     try:
-        print(f"[DEBUG] rm called with path: {path}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] rm called with path: {path}", file=sys.stderr)
+        _invalidate_stat_cache()
         if not os.path.exists(path):
             if force:
                 return f"Warning: Path '{path}' does not exist, nothing removed"
@@ -435,7 +546,7 @@ def fastfs_rm(path: str, recursive: bool = False, force: bool = False) -> str:
             if not recursive:
                 item_count = len(os.listdir(path))
                 return f"Error: '{path}' is a directory with {item_count} items. Set recursive=True to remove directories. Use tree('{path}', depth=1) to preview contents."
-            item_count = sum(1 for _ in os.walk(path))
+            item_count = sum(1 for _ in _iter_entries(path))
             shutil.rmtree(path)
             return f"Successfully removed directory '{path}' ({item_count} items deleted)"
         else:
@@ -445,14 +556,16 @@ def fastfs_rm(path: str, recursive: bool = False, force: bool = False) -> str:
     except PermissionError:
         return f"Error: Permission denied removing '{path}'. Check permissions with stat('{path}')."
     except Exception as e:
-        print(f"[ERROR] rm failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] rm failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="Create a new empty file or update its timestamp.")
 def fastfs_touch(path: str) -> str:
     """Create a new empty file or update its timestamp."""
     try:
-        print(f"[DEBUG] touch called with path: {path}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] touch called with path: {path}", file=sys.stderr)
+        _invalidate_stat_cache()
         directory = os.path.dirname(path)
         if directory and not os.path.exists(directory):
             os.makedirs(directory)
@@ -461,14 +574,16 @@ def fastfs_touch(path: str) -> str:
             os.utime(path, None)
         return f"Successfully touched '{path}'"
     except Exception as e:
-        print(f"[ERROR] touch failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] touch failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="Create a new directory.")
 def fastfs_mkdir(path: str, parents: bool = False) -> str:
     """Create a new directory."""
     try:
-        print(f"[DEBUG] mkdir called with path: {path}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] mkdir called with path: {path}", file=sys.stderr)
+        _invalidate_stat_cache()
         if os.path.exists(path):
             return f"Error: Path '{path}' already exists"
         
@@ -478,49 +593,49 @@ def fastfs_mkdir(path: str, parents: bool = False) -> str:
             os.mkdir(path)
         return f"Successfully created directory '{path}'"
     except Exception as e:
-        print(f"[ERROR] mkdir failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] mkdir failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="Show disk usage of a directory.")
 def fastfs_du(path: str = ".", human_readable: bool = True, max_depth: int = 1) -> str:
     """Show disk usage of a directory."""
     try:
-        print(f"[DEBUG] du called with path: {path}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] du called with path: {path}", file=sys.stderr)
         if not os.path.exists(path):
             return f"Error: Path '{path}' does not exist"
         
-        # Escape path for shell command
-        escaped_path = path.replace("'", "'\\''")
-        cmd = f"du -{'h' if human_readable else ''}d {max_depth} '{escaped_path}'"
-        result = run_command(cmd)
+        result = run_command(["du", f"-{'h' if human_readable else ''}d", str(max_depth), "--", path])
         
         if not result:
             return f"No output from du command on path '{path}'"
         return result
     except Exception as e:
-        print(f"[ERROR] du failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] du failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="Show disk space and usage.")
 def fastfs_df(human_readable: bool = True) -> str:
     """Show disk space and usage."""
     try:
-        print(f"[DEBUG] df called", file=sys.stderr, flush=True)
-        cmd = f"df {'-h' if human_readable else ''}"
-        result = run_command(cmd)
+        if _DEBUG:
+            print(f"[DEBUG] df called", file=sys.stderr)
+        result = run_command(["df", "-h"] if human_readable else ["df"])
         
         if not result:
             return "No output from df command"
         return result
     except Exception as e:
-        print(f"[ERROR] df failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] df failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="Change file mode (permissions).")
 def fastfs_chmod(path: str, mode: str) -> str:
     """Change file mode (permissions)."""
     try:
-        print(f"[DEBUG] chmod called with path: {path}, mode: {mode}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] chmod called with path: {path}, mode: {mode}", file=sys.stderr)
+        _invalidate_stat_cache()
         if not os.path.exists(path):
             return f"Error: Path '{path}' does not exist"
         
@@ -530,233 +645,337 @@ def fastfs_chmod(path: str, mode: str) -> str:
             os.chmod(path, mode_int)
         else:
             # For symbolic mode, use chmod command
-            escaped_path = path.replace("'", "'\\''")
-            cmd = f"chmod {mode} '{escaped_path}'"
-            run_command(cmd)
+            result = run_command(["chmod", mode, "--", path])
+            if result.startswith(("Error:", "Exception:")):
+                return result
             
         return f"Successfully changed mode of '{path}' to {mode}"
     except Exception as e:
-        print(f"[ERROR] chmod failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] chmod failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="Change file owner and group.")
 def fastfs_chown(path: str, owner: str, group: Optional[str] = None) -> str:
     """Change file owner and group."""
     try:
-        print(f"[DEBUG] chown called with path: {path}, owner: {owner}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] chown called with path: {path}, owner: {owner}", file=sys.stderr)
+        _invalidate_stat_cache()
         if not os.path.exists(path):
             return f"Error: Path '{path}' does not exist"
         
         # Use chown command as Python's os.chown requires numeric IDs
         owner_group = owner if group is None else f"{owner}:{group}"
-        escaped_path = path.replace("'", "'\\''")
-        cmd = f"chown {owner_group} '{escaped_path}'"
-        result = run_command(cmd)
+        result = run_command(["chown", owner_group, "--", path])
         
         if "error" in result.lower():
             return result
         return f"Successfully changed owner of '{path}' to {owner_group}"
     except Exception as e:
-        print(f"[ERROR] chown failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] chown failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
+# Reading many small files is dominated by open/read latency, so cat reads
+# them on a small pool of threads
+_CAT_READ_WORKERS = 8
+_cat_read_executor = ThreadPoolExecutor(max_workers=_CAT_READ_WORKERS, thread_name_prefix="fastfs-cat")
+
+def _read_text_file(path: str) -> str:
+    """Read a whole UTF-8 text file as bytes and decode it in one call."""
+    with _open_read(path) as f:
+        return f.read().decode('utf-8')
+
 @mcp.tool(description="Concatenate and display file contents.")
 def fastfs_cat(paths: List[str]) -> str:
     """Concatenate and display file contents."""
     try:
-        print(f"[DEBUG] cat called with paths: {paths}", file=sys.stderr, flush=True)
-        result = ""
-        
+        if _DEBUG:
+            print(f"[DEBUG] cat called with paths: {paths}", file=sys.stderr)
         for path in paths:
-            if not os.path.exists(path):
-                return f"Error: File '{path}' does not exist"
-            if not os.path.isfile(path):
-                return f"Error: '{path}' is not a file"
-            
-            with open(path, 'r', encoding='utf-8') as f:
-                result += f.read()
+            error = _check_file(path)
+            if error:
+                return f"Error: {error}"
+        
+        # Collect the contents in order and join once; repeated += copies the
+        # growing result for every file
+        if len(paths) > 2:
+            parts = list(_cat_read_executor.map(_read_text_file, paths))
+        else:
+            parts = [_read_text_file(path) for path in paths]
                 
-        return result
+        return "".join(parts)
     except Exception as e:
-        print(f"[ERROR] cat failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] cat failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="Display the first part of files.")
 def fastfs_head(path: str, lines: int = 10) -> str:
     """Display the first part of files."""
     try:
-        print(f"[DEBUG] head called with path: {path}, lines: {lines}", file=sys.stderr, flush=True)
-        if not os.path.exists(path):
-            return f"Error: File '{path}' does not exist"
-        if not os.path.isfile(path):
-            return f"Error: '{path}' is not a file"
+        if _DEBUG:
+            print(f"[DEBUG] head called with path: {path}, lines: {lines}", file=sys.stderr)
+        error = _check_file(path)
+        if error:
+            return f"Error: {error}"
         
-        with open(path, 'r', encoding='utf-8') as f:
-            result = ''.join(f.readline() for _ in range(lines))
+        # Let the file iterator drive the loop in C; the text layer ends lines
+        # at \r\n and lone \r as well, like nl, and returns them as \n
+        with io.TextIOWrapper(_open_read(path), encoding='utf-8', errors='replace') as f:
+            result = ''.join(itertools.islice(f, max(lines, 0)))
             
         return result
     except Exception as e:
-        print(f"[ERROR] head failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] head failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
+# Block size used when reading a file backwards from its end
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+def _read_last_lines(path: str, lines: int) -> bytes:
+    """Return the last `lines` lines of a file as bytes, reading from the end."""
+    if lines <= 0:
+        return b""
+    with _open_read(path) as f:
+        end = f.seek(0, os.SEEK_END)
+        data = b""
+        while end > 0:
+            block = min(_TAIL_BLOCK_SIZE, end)
+            end -= block
+            f.seek(end)
+            data = f.read(block) + data
+            # Enough once `lines` newlines precede the file's final byte
+            if data.count(b"\n", 0, len(data) - 1) >= lines:
+                break
+    if data.endswith(b"\n"):
+        data = data[:-1]
+    return b"\n".join(data.split(b"\n")[-lines:])
+
 @mcp.tool(description="Display the last part of files.")
 def fastfs_tail(path: str, lines: int = 10) -> str:
     """Display the last part of files."""
     try:
-        print(f"[DEBUG] tail called with path: {path}, lines: {lines}", file=sys.stderr, flush=True)
-        if not os.path.exists(path):
-            return f"Error: File '{path}' does not exist"
-        if not os.path.isfile(path):
-            return f"Error: '{path}' is not a file"
+        if _DEBUG:
+            print(f"[DEBUG] tail called with path: {path}, lines: {lines}", file=sys.stderr)
+        error = _check_file(path)
+        if error:
+            return f"Error: {error}"
         
-        # Using the tail command for efficiency with large files
-        escaped_path = path.replace("'", "'\\''")
-        cmd = f"tail -n {lines} '{escaped_path}'"
-        result = run_command(cmd)
+        # Read backwards from the end of the file so only the last few blocks
+        # are touched, however large the file is
+        result = _read_last_lines(path, lines).decode('utf-8', errors='replace').rstrip("\n")
         
         if not result:
             return f"No output from tail command on file '{path}'"
         return result
     except Exception as e:
-        print(f"[ERROR] tail failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] tail failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="Print the resolved path of a symbolic link.")
 def fastfs_readlink(path: str) -> str:
     """Print the resolved path of a symbolic link."""
     try:
-        print(f"[DEBUG] readlink called with path: {path}", file=sys.stderr, flush=True)
-        if not os.path.exists(path):
+        if _DEBUG:
+            print(f"[DEBUG] readlink called with path: {path}", file=sys.stderr)
+        # lstat once: the link itself may point nowhere
+        try:
+            st = os.lstat(path)
+        except OSError:
             return f"Error: Path '{path}' does not exist"
-        if not os.path.islink(path):
+        if not stat.S_ISLNK(st.st_mode):
             return f"Error: '{path}' is not a symbolic link"
         
         return os.readlink(path)
     except Exception as e:
-        print(f"[ERROR] readlink failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] readlink failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="Print the resolved absolute path.")
 def fastfs_realpath(path: str) -> str:
     """Print the resolved absolute path."""
     try:
-        print(f"[DEBUG] realpath called with path: {path}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] realpath called with path: {path}", file=sys.stderr)
         if not os.path.exists(path):
             return f"Error: Path '{path}' does not exist"
         
         return os.path.realpath(path)
     except Exception as e:
-        print(f"[ERROR] realpath failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] realpath failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 # ===== TEXT MANIPULATION TOOLS =====
 
+# Leading number of a sort key, as compared by sort -n
+_LEADING_NUMBER_RE = re.compile(r"\s*(-?(?:\d+(?:\.\d*)?|\.\d+))")
+
+def _read_text_lines(path: str) -> List[str]:
+    """Read a text file as a list of lines without their newlines."""
+    content = _read_text_file(path)
+    if content.endswith("\n"):
+        content = content[:-1]
+    return content.split("\n") if content else []
+
+def _parse_field_list(fields: str) -> Optional[List[Tuple[int, int]]]:
+    """Parse a cut field list such as "1,3-5,7-" into inclusive 1-based ranges."""
+    ranges = []
+    for item in fields.split(","):
+        start, sep, end = item.strip().partition("-")
+        try:
+            first = int(start) if start else 1
+            last = (int(end) if end else sys.maxsize) if sep else first
+        except ValueError:
+            return None
+        if first < 1 or last < first:
+            return None
+        ranges.append((first, last))
+    return ranges
+
 @mcp.tool(description="Select specific columns from each line.")
 def fastfs_cut(path: str, delimiter: str = '\t', fields: str = '1') -> str:
     """Select specific columns from each line."""
     try:
-        print(f"[DEBUG] cut called with path: {path}, delimiter: {delimiter}, fields: {fields}", file=sys.stderr, flush=True)
-        if not os.path.exists(path):
-            return f"Error: File '{path}' does not exist"
-        if not os.path.isfile(path):
-            return f"Error: '{path}' is not a file"
+        if _DEBUG:
+            print(f"[DEBUG] cut called with path: {path}, delimiter: {delimiter}, fields: {fields}", file=sys.stderr)
+        error = _check_file(path)
+        if error:
+            return f"Error: {error}"
         
-        # Escape for shell command
-        escaped_path = path.replace("'", "'\\''")
-        escaped_delimiter = delimiter.replace("'", "'\\''")
-        cmd = f"cut -d'{escaped_delimiter}' -f{fields} '{escaped_path}'"
-        result = run_command(cmd)
+        if len(delimiter) != 1:
+            return "Error: the delimiter must be a single character"
+        ranges = _parse_field_list(fields)
+        if ranges is None:
+            return f"Error: invalid field list '{fields}'"
+        
+        # Like cut, lines without the delimiter are passed through whole
+        output = []
+        for line in _read_text_lines(path):
+            if delimiter not in line:
+                output.append(line)
+                continue
+            columns = line.split(delimiter)
+            output.append(delimiter.join(
+                column for index, column in enumerate(columns, 1)
+                if any(start <= index <= end for start, end in ranges)
+            ))
+        result = "\n".join(output).rstrip("\n")
         
         if not result:
             return f"No output from cut command on file '{path}'"
         return result
     except Exception as e:
-        print(f"[ERROR] cut failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] cut failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="Sort lines of text files.")
 def fastfs_sort(path: str, reverse: bool = False, numeric: bool = False, field: Optional[int] = None) -> str:
     """Sort lines of text files."""
     try:
-        print(f"[DEBUG] sort called with path: {path}", file=sys.stderr, flush=True)
-        if not os.path.exists(path):
-            return f"Error: File '{path}' does not exist"
-        if not os.path.isfile(path):
-            return f"Error: '{path}' is not a file"
+        if _DEBUG:
+            print(f"[DEBUG] sort called with path: {path}", file=sys.stderr)
+        error = _check_file(path)
+        if error:
+            return f"Error: {error}"
         
-        # Build sort options
-        options = []
-        if reverse:
-            options.append('-r')
-        if numeric:
-            options.append('-n')
-        if field is not None:
-            options.append(f'-k{field}')
+        if field is not None and field < 1:
+            return f"Error: invalid field number {field}"
         
-        # Escape for shell command
-        escaped_path = path.replace("'", "'\\''")
-        cmd = f"sort {' '.join(options)} '{escaped_path}'"
-        result = run_command(cmd)
+        # Sort on the key, falling back to the whole line for ties as sort does
+        def sort_key(line: str) -> Tuple[Any, str]:
+            key = line
+            if field is not None:
+                parts = line.split(None, field - 1)
+                key = parts[field - 1] if len(parts) >= field else ""
+            if numeric:
+                match = _LEADING_NUMBER_RE.match(key)
+                return (float(match.group(1)) if match else 0.0, line)
+            return (key, line)
+        
+        result = "\n".join(sorted(_read_text_lines(path), key=sort_key, reverse=reverse)).rstrip("\n")
         
         if not result:
             return f"No output from sort command on file '{path}'"
         return result
     except Exception as e:
-        print(f"[ERROR] sort failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] sort failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="Report or filter out repeated lines.")
 def fastfs_uniq(path: str, count: bool = False, repeated: bool = False, ignore_case: bool = False) -> str:
     """Report or filter out repeated lines."""
     try:
-        print(f"[DEBUG] uniq called with path: {path}", file=sys.stderr, flush=True)
-        if not os.path.exists(path):
-            return f"Error: File '{path}' does not exist"
-        if not os.path.isfile(path):
-            return f"Error: '{path}' is not a file"
-        
-        # Build uniq options
-        options = []
-        if count:
-            options.append('-c')
-        if repeated:
-            options.append('-d')
-        if ignore_case:
-            options.append('-i')
+        if _DEBUG:
+            print(f"[DEBUG] uniq called with path: {path}", file=sys.stderr)
+        error = _check_file(path)
+        if error:
+            return f"Error: {error}"
         
-        # Escape for shell command
-        escaped_path = path.replace("'", "'\\''")
-        cmd = f"uniq {' '.join(options)} '{escaped_path}'"
-        result = run_command(cmd)
+        # Group adjacent equal lines; the first line of each group is reported
+        output = []
+        key = str.lower if ignore_case else None
+        for _, group in itertools.groupby(_read_text_lines(path), key=key):
+            group = list(group)
+            if repeated and len(group) < 2:
+                continue
+            output.append(f"{len(group):7d} {group[0]}" if count else group[0])
+        result = "\n".join(output).rstrip("\n")
         
         if not result:
             return f"No output from uniq command on file '{path}'"
         return result
     except Exception as e:
-        print(f"[ERROR] uniq failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] uniq failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
+# Characters read per chunk when counting lines and words
+_WC_CHUNK_SIZE = 1024 * 1024
+
 @mcp.tool(description="Print line, word, and byte counts.")
 def fastfs_wc(path: str, lines: bool = True, words: bool = True, bytes: bool = True) -> Dict[str, int]:
     """Print line, word, and byte counts."""
     try:
-        print(f"[DEBUG] wc called with path: {path}", file=sys.stderr, flush=True)
-        if not os.path.exists(path):
-            return {"error": f"File '{path}' does not exist"}
-        if not os.path.isfile(path):
-            return {"error": f"'{path}' is not a file"}
+        if _DEBUG:
+            print(f"[DEBUG] wc called with path: {path}", file=sys.stderr)
+        error = _check_file(path)
+        if error:
+            return {"error": error}
         
         result = {}
         
-        # Count lines if requested
-        if lines:
-            with open(path, 'r', encoding='utf-8') as f:
-                result["lines"] = sum(1 for _ in f)
-        
-        # Count words if requested
-        if words:
-            with open(path, 'r', encoding='utf-8') as f:
-                result["words"] = sum(len(line.split()) for line in f)
+        # Count lines and words in a single pass over the file
+        if lines or words:
+            line_count = 0
+            word_count = 0
+            last_char = ""
+            in_word = False
+            # Counting lines alone needs no decoding, so scan raw bytes then;
+            # both paths end lines at \n, \r\n and lone \r (universal newlines)
+            newlines = ("\n",) if words else (b"\n", b"\r")
+            with _open_read(path, 'r' if words else 'rb') as f:
+                while True:
+                    chunk = f.read(_WC_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if words:
+                        line_count += chunk.count("\n")
+                        word_count += len(chunk.split())
+                        # A word split across two chunks was counted twice
+                        if in_word and not chunk[0].isspace():
+                            word_count -= 1
+                        in_word = not chunk[-1].isspace()
+                    else:
+                        line_count += chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+                        # A \r\n split across two chunks was counted twice
+                        if last_char == b"\r" and chunk[:1] == b"\n":
+                            line_count -= 1
+                    last_char = chunk[-1:]
+            # A final line without a trailing newline still counts
+            if last_char and last_char not in newlines:
+                line_count += 1
+            if lines:
+                result["lines"] = line_count
+            if words:
+                result["words"] = word_count
         
         # Count bytes if requested
         if bytes:
@@ -764,142 +983,255 @@ def fastfs_wc(path: str, lines: bool = True, words: bool = True, bytes: bool = T
             
         return result
     except Exception as e:
-        print(f"[ERROR] wc failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] wc failed: {str(e)}", file=sys.stderr)
         return {"error": str(e)}
 
 @mcp.tool(description="Number lines in a file.")
 def fastfs_nl(path: str, number_empty: bool = True, number_format: str = '%6d  ') -> str:
     """Number lines in a file."""
     try:
-        print(f"[DEBUG] nl called with path: {path}", file=sys.stderr, flush=True)
-        if not os.path.exists(path):
-            return f"Error: File '{path}' does not exist"
-        if not os.path.isfile(path):
-            return f"Error: '{path}' is not a file"
+        if _DEBUG:
+            print(f"[DEBUG] nl called with path: {path}", file=sys.stderr)
+        error = _check_file(path)
+        if error:
+            return f"Error: {error}"
         
-        # Number lines
-        result = []
-        with open(path, 'r', encoding='utf-8') as f:
-            for i, line in enumerate(f, 1):
-                if number_empty or line.strip():
-                    result.append(number_format % i + line)
-                else:
-                    result.append(line)
+        # Read and decode the file once, then number the lines in a single
+        # comprehension; text after the last newline is numbered too
+        with _open_read(path) as f:
+            text = f.read().decode('utf-8', errors='replace')
+        # Treat \r\n and lone \r as line ends, as the text-mode read used to
+        lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        numbered = [
+            number_format % i + line if number_empty or line.strip() else line
+            for i, line in enumerate(lines, 1)
+        ]
+        if not lines[-1]:
+            # The empty string after a trailing newline is not a line
+            numbered[-1] = ''
         
-        return ''.join(result)
+        return '\n'.join(numbered)
     except Exception as e:
-        print(f"[ERROR] nl failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] nl failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
+# Buffer size for copying file data in split and the compression tools
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Multipliers for split's size suffixes: K, M, ... are powers of 1024 and
+# KB, MB, ... powers of 1000
+_SIZE_SUFFIXES = {
+    "": 1, "B": 1,
+    **{unit: 1024 ** power for power, unit in enumerate("KMGTPE", 1)},
+    **{unit + "iB": 1024 ** power for power, unit in enumerate("KMGTPE", 1)},
+    **{unit + "B": 1000 ** power for power, unit in enumerate("KMGTPE", 1)},
+}
+_SIZE_RE = re.compile(r"(\d+)([KMGTPE]?(?:iB|B)?)")
+
+def _parse_size(size: str) -> Optional[int]:
+    """Parse a size such as "512", "10K" or "1MB" like split -b does."""
+    match = _SIZE_RE.fullmatch(size.strip())
+    if not match or match.group(2) not in _SIZE_SUFFIXES:
+        return None
+    return int(match.group(1)) * _SIZE_SUFFIXES[match.group(2)]
+
+def _split_suffixes() -> Iterator[str]:
+    """Yield split's default output suffixes: aa..yz, then zaaa..zyzz, zzaaaa.., as GNU split widens them."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    width = 0
+    while True:
+        for combo in itertools.product(letters[:-1], *([letters] * (width + 1))):
+            yield "z" * width + "".join(combo)
+        width += 1
+
 @mcp.tool(description="Split a file into smaller parts.")
 def fastfs_split(path: str, prefix: str = 'x', lines: Optional[int] = 1000, bytes_size: Optional[str] = None) -> str:
     """Split a file into smaller parts."""
     try:
-        print(f"[DEBUG] split called with path: {path}", file=sys.stderr, flush=True)
-        if not os.path.exists(path):
-            return f"Error: File '{path}' does not exist"
-        if not os.path.isfile(path):
-            return f"Error: '{path}' is not a file"
+        if _DEBUG:
+            print(f"[DEBUG] split called with path: {path}", file=sys.stderr)
+        _invalidate_stat_cache()
+        error = _check_file(path)
+        if error:
+            return f"Error: {error}"
         
-        # Build split options
-        options = []
-        if lines is not None:
-            options.append(f'-l {lines}')
-        if bytes_size is not None:
-            options.append(f'-b {bytes_size}')
+        names = (prefix + suffix for suffix in _split_suffixes())
+        parts = 0
         
-        # Escape for shell command
-        escaped_path = path.replace("'", "'\\''")
-        escaped_prefix = prefix.replace("'", "'\\''")
-        cmd = f"split {' '.join(options)} '{escaped_path}' '{escaped_prefix}'"
-        result = run_command(cmd)
+        if bytes_size is not None:
+            # Fixed-size pieces are copied by the kernel without passing
+            # through Python buffers
+            chunk_size = _parse_size(bytes_size)
+            if not chunk_size:
+                return f"Error: invalid number of bytes: '{bytes_size}'"
+            size = os.path.getsize(path)
+            with open(path, 'rb') as src:
+                for offset in range(0, size, chunk_size):
+                    with open(next(names), 'wb') as dst:
+                        copied, wanted = 0, min(chunk_size, size - offset)
+                        while copied < wanted:
+                            sent = os.sendfile(dst.fileno(), src.fileno(), offset + copied, wanted - copied)
+                            if not sent:
+                                break
+                            copied += sent
+                    parts += 1
+        else:
+            if lines is None or lines < 1:
+                return f"Error: invalid number of lines: '{lines}'"
+            # Copy whole buffers at a time, locating piece boundaries with find
+            dst = None
+            remaining = 0
+            try:
+                with open(path, 'rb') as src:
+                    while True:
+                        chunk = src.read(_COPY_BUFFER_SIZE)
+                        if not chunk:
+                            break
+                        start = 0
+                        while start < len(chunk):
+                            if remaining == 0:
+                                if dst:
+                                    dst.close()
+                                dst = open(next(names), 'wb')
+                                parts += 1
+                                remaining = lines
+                            end = start
+                            while remaining and end < len(chunk):
+                                newline = chunk.find(b"\n", end)
+                                if newline == -1:
+                                    end = len(chunk)
+                                    break
+                                end = newline + 1
+                                remaining -= 1
+                            dst.write(chunk[start:end])
+                            start = end
+            finally:
+                if dst:
+                    dst.close()
         
-        # List the created files
-        files = glob.glob(f"{prefix}*")
-        return f"Successfully split '{path}' into {len(files)} parts with prefix '{prefix}'"
+        return f"Successfully split '{path}' into {parts} parts with prefix '{prefix}'"
     except Exception as e:
-        print(f"[ERROR] split failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] split failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 # ===== ARCHIVE & COMPRESSION TOOLS =====
 
+# tar flag for each supported operation
+_TAR_OP_FLAGS = {
+    "create": "c",
+    "extract": "x",
+    "list": "t"
+}
+# Archive extension -> (tarfile compression, tar compression flag)
+_TAR_COMPRESSION = (
+    ('.gz', 'gz', 'z'),
+    ('.tgz', 'gz', 'z'),
+    ('.bz2', 'bz2', 'j'),
+    ('.xz', 'xz', 'J'),
+)
+
+def _tar_compression(archive_file: str) -> Tuple[str, str]:
+    """Return the tarfile compression and tar flag implied by an archive's extension."""
+    return next(
+        ((module, flag) for ext, module, flag in _TAR_COMPRESSION if archive_file.endswith(ext)),
+        ('', '')
+    )
+
 @mcp.tool(description="Create, extract, or list tar archives.")
 def fastfs_tar(operation: str, archive_file: str, files: Optional[List[str]] = None, options: str = "") -> str:
     """Create, extract, or list tar archives.
     Operation: 'create', 'extract', or 'list'
     """
     try:
-        print(f"[DEBUG] tar called with operation: {operation}, archive: {archive_file}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] tar called with operation: {operation}, archive: {archive_file}", file=sys.stderr)
+        _invalidate_stat_cache()
         
-        # Map operation to tar flag
-        op_flags = {
-            "create": "c",
-            "extract": "x",
-            "list": "t"
-        }
-        
-        if operation not in op_flags:
+        flag = _TAR_OP_FLAGS.get(operation)
+        if flag is None:
             return f"Error: Invalid operation '{operation}'. Use 'create', 'extract', or 'list'."
+        compression_module, compression = _tar_compression(archive_file)
         
-        flag = op_flags[operation]
-        # Always use verbose mode
-        cmd = f"tar -{flag}vf"
-        
-        # Add compression based on file extension
-        if archive_file.endswith('.gz') or archive_file.endswith('.tgz'):
-            cmd += 'z'
-        elif archive_file.endswith('.bz2'):
-            cmd += 'j'
-        elif archive_file.endswith('.xz'):
-            cmd += 'J'
-            
-        # Add any extra options
+        # Extra tar options can only be honoured by the tar binary
         if options:
-            cmd += f" {options}"
-            
-        # Escape archive filename
-        escaped_archive = archive_file.replace("'", "'\\''")
-        cmd += f" '{escaped_archive}'"
+            # Always use verbose mode
+            cmd = ["tar", f"-{flag}v{compression}f", archive_file, *shlex.split(options)]
+            if operation == "create" and files:
+                cmd.extend(["--", *files])
+            result = run_command(cmd)
+            return result or f"Successfully {operation}ed archive '{archive_file}'"
         
-        # Add files for create operation
-        if operation == "create" and files:
-            file_list = []
-            for f in files:
-                escaped_file = f.replace("'", "'\\''")
-                file_list.append(f"'{escaped_file}'")
-            file_args = " ".join(file_list)
-            cmd += f" {file_args}"
+        # Otherwise work in-process, listing member names like tar -v does
+        names = []
+        if operation == "create":
+            def record(member: tarfile.TarInfo) -> tarfile.TarInfo:
+                names.append(member.name)
+                return member
             
-        result = run_command(cmd)
-        return result or f"Successfully {operation}ed archive '{archive_file}'"
+            with tarfile.open(archive_file, f"w:{compression_module}") as archive:
+                for path in files or []:
+                    archive.add(path, filter=record)
+        elif operation == "extract":
+            with tarfile.open(archive_file, "r:*") as archive:
+                members = archive.getmembers()
+                # Refuse absolute paths and links that escape the destination
+                if hasattr(tarfile, "data_filter"):
+                    archive.extractall(members=members, filter="data")
+                else:
+                    archive.extractall(members=members)
+                names = [member.name for member in members]
+        else:
+            with tarfile.open(archive_file, "r:*") as archive:
+                names = archive.getnames()
+        
+        return "\n".join(names) or f"Successfully {operation}ed archive '{archive_file}'"
     except Exception as e:
-        print(f"[ERROR] tar failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] tar failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="Compress or decompress files.")
 def fastfs_gzip(path: str, decompress: bool = False, keep: bool = False) -> str:
     """Compress or decompress files using gzip."""
     try:
-        print(f"[DEBUG] gzip called with path: {path}, decompress: {decompress}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] gzip called with path: {path}, decompress: {decompress}", file=sys.stderr)
+        _invalidate_stat_cache()
         if not os.path.exists(path):
             return f"Error: Path '{path}' does not exist"
         
-        # Build gzip options
-        options = []
+        # Like gzip: compress to path.gz, decompress only .gz files, never
+        # overwrite, and carry the permissions and timestamps over
         if decompress:
-            options.append('-d')
-        if keep:
-            options.append('-k')
+            if not path.endswith('.gz'):
+                return f"Error: gzip: {path}: unknown suffix -- ignored"
+            output = path[:-3]
+        else:
+            if path.endswith('.gz'):
+                return f"Error: gzip: {path} already has .gz suffix -- unchanged"
+            output = path + '.gz'
+        if os.path.exists(output):
+            return f"Error: gzip: {output} already exists"
         
-        # Escape for shell command
-        escaped_path = path.replace("'", "'\\''")
-        cmd = f"gzip {' '.join(options)} '{escaped_path}'"
-        result = run_command(cmd)
+        try:
+            if decompress:
+                with gzip.open(path, 'rb') as src, open(output, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+            else:
+                with open(path, 'rb') as src, gzip.open(output, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+        except BaseException:
+            # Don't leave a partial output behind
+            if os.path.exists(output):
+                os.remove(output)
+            raise
+        shutil.copystat(path, output)
+        if not keep:
+            os.remove(path)
         
         action = "Decompressed" if decompress else "Compressed"
-        return result or f"Successfully {action} '{path}'"
+        return f"Successfully {action} '{path}'"
     except Exception as e:
-        print(f"[ERROR] gzip failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] gzip failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 @mcp.tool(description="Create or extract zip archives.")
@@ -908,7 +1240,9 @@ def fastfs_zip(operation: str, archive_file: str, files: Optional[List[str]] = N
     Operation: 'create' or 'extract'
     """
     try:
-        print(f"[DEBUG] zip called with operation: {operation}, archive: {archive_file}", file=sys.stderr, flush=True)
+        if _DEBUG:
+            print(f"[DEBUG] zip called with operation: {operation}, archive: {archive_file}", file=sys.stderr)
+        _invalidate_stat_cache()
         
         if operation not in ["create", "extract"]:
             return f"Error: Invalid operation '{operation}'. Use 'create' or 'extract'."
@@ -917,44 +1251,114 @@ def fastfs_zip(operation: str, archive_file: str, files: Optional[List[str]] = N
             if not files:
                 return "Error: No files specified for zip creation"
             
-            # Escape archive filename and files
-            escaped_archive = archive_file.replace("'", "'\\''")
-            file_list = []
-            for f in files:
-                escaped_file = f.replace("'", "'\\''")
-                file_list.append(f"'{escaped_file}'")
-            file_args = " ".join(file_list)
+            # Extra options and updates of an existing archive need the zip binary
+            if options or os.path.exists(archive_file):
+                result = run_command(["zip", *shlex.split(options), archive_file, "--", *files])
+                return result or f"Successfully created zip archive '{archive_file}'"
             
-            cmd = f"zip {options} '{escaped_archive}' {file_args}"
-            result = run_command(cmd)
-            return result or f"Successfully created zip archive '{archive_file}'"
+            # Like zip without -r, directories are stored as entries only
+            added = []
+            with zipfile.ZipFile(archive_file, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                for path in files:
+                    archive.write(path)
+                    added.append(f"  adding: {path}")
+            return "\n".join(added) or f"Successfully created zip archive '{archive_file}'"
             
         else:  # extract
             if not os.path.exists(archive_file):
                 return f"Error: Archive '{archive_file}' does not exist"
-                
-            # Escape archive filename
-            escaped_archive = archive_file.replace("'", "'\\''")
-            cmd = f"unzip {options} '{escaped_archive}'"
-            result = run_command(cmd)
-            return result or f"Successfully extracted zip archive '{archive_file}'"
+            
+            if options:
+                result = run_command(["unzip", *shlex.split(options), archive_file])
+                return result or f"Successfully extracted zip archive '{archive_file}'"
+            
+            extracted = []
+            links = []
+            with zipfile.ZipFile(archive_file) as archive:
+                for info in archive.infolist():
+                    unix_mode = info.external_attr >> 16
+                    target = archive.extract(info)
+                    if stat.S_ISLNK(unix_mode):
+                        # The entry's data is the link target; create links
+                        # after everything else so no entry is written through one
+                        with open(target, 'r', encoding='utf-8', errors='surrogateescape') as f:
+                            links.append((target, f.read()))
+                        continue
+                    # Restore Unix permissions recorded in the archive, as unzip
+                    # does: without -K it drops setuid, setgid and sticky bits
+                    mode = unix_mode & 0o777
+                    if mode and not info.is_dir():
+                        os.chmod(target, mode)
+                    extracted.append(f"  inflating: {target}")
+                for target, link_target in links:
+                    os.remove(target)
+                    os.symlink(link_target, target)
+                    extracted.append(f"    linking: {target}  -> {link_target}")
+            return "\n".join(extracted) or f"Successfully extracted zip archive '{archive_file}'"
     except Exception as e:
-        print(f"[ERROR] zip failed: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[ERROR] zip failed: {str(e)}", file=sys.stderr)
         return f"Error: {str(e)}"
 
 # ===== REGISTER GIT TOOLS =====
 
+# Git tools run on a worker pool so a slow clone or log on a large repository
+# doesn't block the event loop (and every other tool call) while it runs
+_GIT_WORKERS = int(os.environ.get("FASTFS_WORKERS", max(8, 3 * (os.cpu_count() or 1))))
+_git_tool_executor = ThreadPoolExecutor(max_workers=_GIT_WORKERS, thread_name_prefix="fastfs-tool")
+# Tools that modify a repository are serialized per repository
+_repo_write_locks: Dict[str, asyncio.Lock] = {}
+# Git tools run on worker threads against the process-wide working directory,
+# so cd() waits until none are queued or running before changing it
+_git_tools_in_flight = 0
+_git_tools_idle = asyncio.Condition()
+
+@contextlib.asynccontextmanager
+async def _git_tool_slot():
+    """Mark a git tool as in flight for the duration of the block."""
+    global _git_tools_in_flight
+    _git_tools_in_flight += 1
+    try:
+        yield
+    finally:
+        _git_tools_in_flight -= 1
+        async with _git_tools_idle:
+            _git_tools_idle.notify_all()
+
+async def _run_git_tool(func, *args, write: bool = False):
+    """Run a git tool function on the worker pool, holding the repository's write lock for writers."""
+    loop = asyncio.get_running_loop()
+    async with _git_tool_slot():
+        if not write:
+            return await loop.run_in_executor(_git_tool_executor, func, *args)
+        repo = os.path.realpath(os.getcwd())
+        lock = _repo_write_locks.setdefault(repo, asyncio.Lock())
+        async with lock:
+            try:
+                return await loop.run_in_executor(_git_tool_executor, func, *args)
+            finally:
+                # Checkouts, merges, resets etc. may have replaced files
+                _invalidate_stat_cache()
+
 # Git Repository Operations
 @mcp.tool(description="""Clone a Git repository to local filesystem.
 
 Use when: You need to download a repository to work on it locally. Supports GitHub authentication via PAT or GitHub App.
 Prefer over: Manual git commands when working with private repos (authentication is handled automatically).
 
+Parameters:
+- depth: Shallow clone with only this many recent commits (much faster for large histories)
+- filter: Partial clone filter, e.g. "blob:none" to download file contents only when needed
+- single_branch: Fetch only one branch's history
+- branch: Branch to check out
+
 Returns: Success message with clone location.
-Example: clone("https://github.com/user/repo.git") or clone("https://github.com/user/repo.git", "my-local-dir")""")
-def fastfs_clone(repo_url: str, target_dir: Optional[str] = None, options: str = "") -> str:
+Example: clone("https://github.com/user/repo.git") or clone("https://github.com/user/repo.git", "my-local-dir", depth=1)""")
+async def fastfs_clone(repo_url: str, target_dir: Optional[str] = None, options: str = "",
+                       depth: Optional[int] = None, filter: Optional[str] = None,
+                       single_branch: bool = False, branch: Optional[str] = None) -> str:
     """Clone a Git repository."""
-    return git_clone(repo_url, target_dir, options)
+    return await _run_git_tool(git_clone, repo_url, target_dir, options, depth, filter,
+                               single_branch, branch, write=True)
 
 @mcp.tool(description="""Initialize a new Git repository.
 
@@ -963,9 +1367,9 @@ Prefer over: clone() when starting fresh rather than downloading existing code.
 
 Returns: Success message with repository path.
 Example: init(".") or init("new-project")""")
-def fastfs_init(directory: str = ".") -> str:
+async def fastfs_init(directory: str = ".") -> str:
     """Initialize a new Git repository."""
-    return git_init(directory)
+    return await _run_git_tool(git_init, directory, write=True)
 
 @mcp.tool(description="""Add file(s) to the Git staging area for next commit.
 
@@ -974,9 +1378,9 @@ Prefer over: Committing without staging when you want selective commits.
 
 Returns: Confirmation of staged files.
 Example: add(".") for all, add("src/main.py") for specific, add(["file1.py", "file2.py"]) for multiple""")
-def fastfs_add(paths: Union[str, List[str]], options: str = "") -> str:
+async def fastfs_add(paths: Union[str, List[str]], options: str = "") -> str:
     """Add file(s) to the Git staging area."""
-    return git_add(paths, options)
+    return await _run_git_tool(git_add, paths, options, write=True)
 
 @mcp.tool(description="""Commit staged changes to the Git repository.
 
@@ -986,9 +1390,9 @@ Prefer over: Making changes without committing (preserves history and enables co
 IMPORTANT: Creates a permanent record in git history.
 Returns: Commit hash and summary.
 Example: commit("feat: add user authentication") or commit("fix: resolve null pointer issue")""")
-def fastfs_commit(message: str, options: str = "") -> str:
+async def fastfs_commit(message: str, options: str = "") -> str:
     """Commit changes to the Git repository."""
-    return git_commit(message, options)
+    return await _run_git_tool(git_commit, message, options, write=True)
 
 @mcp.tool(
     description="""Show the working tree status - staged, unstaged, and untracked files.
@@ -997,13 +1401,17 @@ Use when: You need to understand the current state before committing, or verify
 Prefer over: Manual file inspection. This is your primary tool for understanding repository state.
 
 IMPORTANT: Always run this BEFORE add() and commit() to verify what you're committing.
+Parameters:
+- untracked: Set to False to skip scanning for untracked files (much faster on large trees)
+- summary: Set to True to only report the branch and whether the tree is clean (stops at the first change)
+
 Returns: Status summary showing modified, staged, and untracked files.
-Example: status() or status("--short") for compact view""",
+Example: status() or status("--short") for compact view, status(untracked=False) for tracked changes only, status(summary=True) for a quick clean check""",
     annotations={"readOnlyHint": True, "openWorldHint": False}
 )
-def fastfs_status(options: str = "") -> str:
+async def fastfs_status(options: str = "", untracked: bool = True, summary: bool = False) -> str:
     """Show the working tree status."""
-    return git_status(options)
+    return await _run_git_tool(git_status, options, untracked, summary)
 
 @mcp.tool(
     description="""Push commits to a remote repository.
@@ -1013,12 +1421,12 @@ Prefer over: Manual sharing of code changes.
 
 DESTRUCTIVE: Publishes commits to remote. Cannot easily undo pushed commits. Requires authentication for private repos.
 Returns: Push result summary.
-Example: push() for default, push("origin", "main") for specific branch""",
+Example: push() for default, push("origin", "main") for specific branch, push("*", "main") to push to every remote concurrently""",
     annotations={"readOnlyHint": False, "destructiveHint": True, "openWorldHint": True}
 )
-def fastfs_push(remote: str = "origin", branch: str = "", options: str = "") -> str:
+async def fastfs_push(remote: str = "origin", branch: str = "", options: str = "") -> str:
     """Push changes to a remote repository."""
-    return git_push(remote, branch, options)
+    return await _run_git_tool(git_push, remote, branch, options, write=True)
 
 @mcp.tool(description="""Pull changes from a remote repository and merge into current branch.
 
@@ -1028,9 +1436,9 @@ Prefer over: Manually fetching and merging.
 CAUTION: May cause merge conflicts if local and remote have diverged.
 Returns: Pull result with changes summary.
 Example: pull() for default, pull("origin", "main") for specific branch""")
-def fastfs_pull(remote: str = "origin", branch: str = "", options: str = "") -> str:
+async def fastfs_pull(remote: str = "origin", branch: str = "", options: str = "") -> str:
     """Pull changes from a remote repository."""
-    return git_pull(remote, branch, options)
+    return await _run_git_tool(git_pull, remote, branch, options, write=True)
 
 @mcp.tool(description="""Show commit history log.
 
@@ -1039,9 +1447,9 @@ Prefer over: Reading individual files to understand what changed.
 
 Returns: Commit list with hashes, authors, dates, and messages.
 Example: log() for recent 10, log("--oneline -n 20") for more, log("--author=name") to filter""")
-def fastfs_log(options: str = "--oneline -n 10") -> str:
+async def fastfs_log(options: str = "--oneline -n 10") -> str:
     """Show commit logs."""
-    return git_log(options)
+    return await _run_git_tool(git_log, options)
 
 @mcp.tool(description="""Switch branches or restore working tree files.
 
@@ -1051,9 +1459,9 @@ Prefer over: Manually editing files to undo changes. Use branch() to see availab
 CAUTION: May lose uncommitted changes. Run status() first to check for unsaved work.
 Returns: Confirmation of checkout.
 Example: checkout("main"), checkout("feature-branch"), checkout("-b new-branch") to create and switch""")
-def fastfs_checkout(revision: str, options: str = "") -> str:
+async def fastfs_checkout(revision: str, options: str = "") -> str:
     """Switch branches or restore working tree files."""
-    return git_checkout(revision, options)
+    return await _run_git_tool(git_checkout, revision, options, write=True)
 
 @mcp.tool(description="""List, create, or delete branches.
 
@@ -1062,9 +1470,25 @@ Prefer over: Guessing branch names. Use with checkout() to switch branches.
 
 Returns: Branch list (current marked with *) or operation result.
 Example: branch() to list, branch(branch_name="feature-x") to create, branch(options="-d", branch_name="old-branch") to delete""")
-def fastfs_branch(options: str = "", branch_name: Optional[str] = None) -> str:
+async def fastfs_branch(options: str = "", branch_name: Optional[str] = None) -> str:
     """List, create, or delete branches."""
-    return git_branch(options, branch_name)
+    return await _run_git_tool(git_branch, options, branch_name, write=True)
+
+@mcp.tool(description="""Create, move, or delete several branches in one atomic operation.
+
+Use when: You need to set up or clean up many branches at once (e.g. deleting merged feature branches, creating release branches).
+Prefer over: Calling branch() repeatedly. All changes are applied in one ref transaction - either all succeed or none do.
+
+Parameters:
+- operations: List of {"action": "create"|"update"|"delete", "name": branch, "target": revision} objects.
+  target is required for create and update. create fails if the branch exists.
+
+CAUTION: delete is forced (like branch -D) and does not check whether the branch is merged. Branches checked out in any worktree cannot be created, moved, or deleted.
+Returns: Summary of the applied operations, or the error if the transaction was rejected.
+Example: branch_batch([{"action": "create", "name": "release-1.2", "target": "main"}, {"action": "delete", "name": "old-feature"}])""")
+async def fastfs_branch_batch(operations: List[Dict[str, str]]) -> str:
+    """Create, move or delete several branches atomically."""
+    return await _run_git_tool(git_branch_batch, operations, write=True)
 
 @mcp.tool(description="""Merge another branch into the current branch.
 
@@ -1074,56 +1498,78 @@ Prefer over: Manual copying of changes between branches.
 CAUTION: May cause merge conflicts. Run status() to ensure clean working tree first.
 Returns: Merge result or conflict information.
 Example: merge("feature-branch") or merge("main")""")
-def fastfs_merge(branch: str, options: str = "") -> str:
+async def fastfs_merge(branch: str, options: str = "") -> str:
     """Join two or more development histories together."""
-    return git_merge(branch, options)
+    return await _run_git_tool(git_merge, branch, options, write=True)
 
 @mcp.tool(description="""Show detailed information about a Git object (commit, tag, etc.).
 
 Use when: You need to see full details of a specific commit including diff, or examine a tag.
 Prefer over: log() when you need full commit details rather than just the list.
 
+Parameters:
+- max_lines: Stop after this many lines (None = unlimited). Useful for huge commits.
+- include_initial_diff: Show the full diff of a root commit (default: only its file count).
+
 Returns: Full commit information including message and changes.
-Example: show("HEAD") for latest, show("abc123") for specific commit, show("v1.0.0") for tag""")
-def fastfs_show(object: str = "HEAD", options: str = "") -> str:
+Example: show("HEAD") for latest, show("abc123") for specific commit, show("v1.0.0") for tag, show("HEAD", max_lines=200) for a preview""")
+async def fastfs_show(object: str = "HEAD", options: str = "", max_lines: Optional[int] = None,
+                      include_initial_diff: bool = False) -> str:
     """Show various types of Git objects."""
-    return git_show(object, options)
+    return await _run_git_tool(git_show, object, options, max_lines, include_initial_diff)
+
+@mcp.tool(
+    description="""Show detailed information about several Git objects in one call.
+
+Use when: You need full details for a list of commits or tags, e.g. reviewing every commit in a range.
+Prefer over: Calling show() repeatedly. Objects are fetched concurrently and results keep the requested order.
+
+Returns: List with the show() output for each object.
+Example: show_many(["HEAD", "HEAD~1", "HEAD~2"]) or show_many(["abc123", "def456"], "--stat")""",
+    annotations={"readOnlyHint": True, "openWorldHint": False}
+)
+async def fastfs_show_many(objects: List[str], options: str = "") -> List[str]:
+    """Show several Git objects concurrently."""
+    return await _run_git_tool(git_show_many, objects, options)
 
 @mcp.tool(description="""Show changes between commits, staging area, and working tree.
 
 Use when: You need to see exactly what changed in files before committing, or compare versions.
 Prefer over: Manually comparing file versions. Essential for code review before commit.
 
+Parameters:
+- max_lines: Stop after this many lines (None = unlimited). Use with large refactors, or pass "--stat" for per-file counts only.
+
 Returns: Unified diff showing additions (+) and deletions (-).
-Example: diff() for unstaged, diff("--staged") for staged, diff("HEAD~1") for last commit""")
-def fastfs_diff(options: str = "", path: Optional[str] = None) -> str:
+Example: diff() for unstaged, diff("--staged") for staged, diff("HEAD~1") for last commit, diff("HEAD~5", max_lines=300) for a preview""")
+async def fastfs_diff(options: str = "", path: Optional[str] = None, max_lines: Optional[int] = None) -> str:
     """Show changes between commits, commit and working tree, etc."""
-    return git_diff(options, path)
+    return await _run_git_tool(git_diff, options, path, max_lines)
 
 @mcp.tool(description="Manage remote repositories.")
-def fastfs_remote(command: str = "show", name: Optional[str] = None, options: str = "") -> str:
+async def fastfs_remote(command: str = "show", name: Optional[str] = None, options: str = "") -> str:
     """Manage remote repositories."""
-    return git_remote(command, name, options)
+    return await _run_git_tool(git_remote, command, name, options, write=True)
 
 @mcp.tool(description="Pick out and massage parameters for low-level Git commands.")
-def fastfs_rev_parse(rev: str, options: str = "") -> str:
+async def fastfs_rev_parse(rev: str, options: str = "") -> str:
     """Pick out and massage parameters for low-level Git commands."""
-    return git_rev_parse(rev, options)
+    return await _run_git_tool(git_rev_parse, rev, options)
 
 @mcp.tool(description="Show information about files in the index and the working tree.")
-def fastfs_ls_files(options: str = "") -> List[str]:
+async def fastfs_ls_files(options: str = "") -> List[str]:
     """Show information about files in the index and the working tree."""
-    return git_ls_files(options)
+    return await _run_git_tool(git_ls_files, options)
 
 @mcp.tool(description="Give an object a human-readable name based on available ref.")
-def fastfs_describe(options: str = "--tags") -> str:
+async def fastfs_describe(options: str = "--tags") -> str:
     """Give an object a human-readable name based on available ref."""
-    return git_describe(options)
+    return await _run_git_tool(git_describe, options)
 
 @mcp.tool(description="Reapply commits on top of another base tip.")
-def fastfs_rebase(branch: str, options: str = "") -> str:
+async def fastfs_rebase(branch: str, options: str = "") -> str:
     """Reapply commits on top of another base tip."""
-    return git_rebase(branch, options)
+    return await _run_git_tool(git_rebase, branch, options, write=True)
 
 @mcp.tool(description="""Stash changes in a dirty working directory temporarily.
 
@@ -1133,9 +1579,9 @@ Prefer over: Committing unfinished work. Stash is temporary storage.
 Commands: 'push' (save), 'pop' (restore and remove), 'apply' (restore and keep), 'list' (show stashes)
 Returns: Stash operation result.
 Example: stash() to save, stash("pop") to restore, stash("list") to see stashes""")
-def fastfs_stash(command: str = "push", options: str = "") -> str:
+async def fastfs_stash(command: str = "push", options: str = "") -> str:
     """Stash the changes in a dirty working directory away."""
-    return git_stash(command, options)
+    return await _run_git_tool(git_stash, command, options, write=True)
 
 @mcp.tool(
     description="""Reset current HEAD to a specified state. DANGEROUS: Can lose uncommitted work.
@@ -1151,9 +1597,9 @@ DESTRUCTIVE with --hard: Permanently loses uncommitted changes!
 Example: reset() to unstage all, reset("HEAD~1") to undo last commit, reset("--hard HEAD") to discard all changes""",
     annotations={"readOnlyHint": False, "destructiveHint": True, "idempotentHint": False, "openWorldHint": False}
 )
-def fastfs_reset(options: str = "", paths: Optional[Union[str, List[str]]] = None) -> str:
+async def fastfs_reset(options: str = "", paths: Optional[Union[str, List[str]]] = None) -> str:
     """Reset current HEAD to the specified state."""
-    return git_reset(options, paths)
+    return await _run_git_tool(git_reset, options, paths, write=True)
 
 @mcp.tool(
     description="""Remove untracked files from the working tree. DANGEROUS: Permanent deletion.
@@ -1170,34 +1616,34 @@ ALWAYS run with -n first to preview, then -f to execute.
 Example: clean() to preview, clean("-f") to delete, clean("-fd") to delete files and directories""",
     annotations={"readOnlyHint": False, "destructiveHint": True, "idempotentHint": False, "openWorldHint": False}
 )
-def fastfs_clean(options: str = "-n") -> str:
+async def fastfs_clean(options: str = "-n") -> str:
     """Remove untracked files from the working tree."""
-    return git_clean(options)
+    return await _run_git_tool(git_clean, options, write=True)
 
 @mcp.tool(description="Create, list, delete or verify a tag object.")
-def fastfs_tag(tag_name: Optional[str] = None, options: str = "") -> Union[str, List[str]]:
+async def fastfs_tag(tag_name: Optional[str] = None, options: str = "") -> Union[str, List[str]]:
     """Create, list, delete or verify a tag object."""
-    return git_tag(tag_name, options)
+    return await _run_git_tool(git_tag, tag_name, options, write=True)
 
 @mcp.tool(description="Get or set repository or global options.")
-def fastfs_config(name: Optional[str] = None, value: Optional[str] = None, options: str = "") -> str:
+async def fastfs_config(name: Optional[str] = None, value: Optional[str] = None, options: str = "") -> str:
     """Get or set repository or global options."""
-    return git_config(name, value, options)
+    return await _run_git_tool(git_config, name, value, options, write=True)
 
-@mcp.tool(description="Download objects and refs from another repository.")
-def fastfs_fetch(remote: str = "origin", options: str = "") -> str:
+@mcp.tool(description="Download objects and refs from another repository. Use remote=\"*\" to fetch all remotes in parallel.")
+async def fastfs_fetch(remote: str = "origin", options: str = "") -> str:
     """Download objects and refs from another repository."""
-    return git_fetch(remote, options)
+    return await _run_git_tool(git_fetch, remote, options, write=True)
 
 @mcp.tool(description="Show what revision and author last modified each line of a file.")
-def fastfs_blame(file_path: str, options: str = "") -> str:
+async def fastfs_blame(file_path: str, options: str = "") -> str:
     """Show what revision and author last modified each line of a file."""
-    return git_blame(file_path, options)
+    return await _run_git_tool(git_blame, file_path, options)
 
 @mcp.tool(description="Print lines matching a pattern in tracked files.")
-def fastfs_git_grep(pattern: str, options: str = "") -> str:
+async def fastfs_git_grep(pattern: str, options: str = "") -> str:
     """Print lines matching a pattern in tracked files."""
-    return git_grep(pattern, options)
+    return await _run_git_tool(git_grep, pattern, options)
 
 # Advanced Git Tools
 @mcp.tool(
@@ -1216,12 +1662,15 @@ Returns structured data including:
 - branches: List of local branches
 - tags: List of tags
 
+Parameters:
+- include_status: Set to False to skip the working tree scan (is_clean/status_summary) on very large repos
+
 Example: context() to get full picture before starting work""",
     annotations={"readOnlyHint": True, "openWorldHint": False}
 )
-def fastfs_context(options: str = "--all") -> Dict[str, Any]:
+async def fastfs_context(options: str = "--all", include_status: bool = True) -> Dict[str, Any]:
     """Get comprehensive context about the current Git repository."""
-    return git_context(options)
+    return await _run_git_tool(git_context, options, include_status)
 
 @mcp.tool(description="""Show the current HEAD commit information in detail.
 
@@ -1230,18 +1679,18 @@ Prefer over: log() when you need complete commit info rather than a list.
 
 Returns: Full commit details including message, author, date, and diff.
 Example: git_show_head()""")
-def fastfs_git_show_head(options: str = "") -> str:
+async def fastfs_git_show_head(options: str = "") -> str:
     """Show the current HEAD commit information."""
-    return git_head(options)
+    return await _run_git_tool(git_head, options)
 
 @mcp.tool(description="""Get the Git version installed in the container.
 
 Use when: Debugging git issues or checking compatibility.
 Returns: Git version string.
 Example: version()""")
-def fastfs_version() -> str:
+async def fastfs_version() -> str:
     """Get the Git version."""
-    return git_version()
+    return await _run_git_tool(git_version)
 
 @mcp.tool(description="""Validate the Git repository for common issues and potential problems.
 
@@ -1255,9 +1704,9 @@ Returns structured validation results:
 - info: Informational notes
 
 Example: validate() to check repo health""")
-def fastfs_validate() -> Dict[str, Any]:
+async def fastfs_validate() -> Dict[str, Any]:
     """Validate the Git repository for common issues."""
-    return git_validate()
+    return await _run_git_tool(git_validate)
 
 @mcp.tool(description="""Get comprehensive statistics and information about the Git repository.
 
@@ -1271,23 +1720,29 @@ Returns detailed info including:
 - size_kb, tag_count, branch_count
 
 Example: repo_info() for full repository statistics""")
-def fastfs_repo_info() -> Dict[str, Any]:
+async def fastfs_repo_info() -> Dict[str, Any]:
     """Get comprehensive information about the Git repository."""
-    return git_repo_info()
+    return await _run_git_tool(git_repo_info)
 
 @mcp.tool(description="""Summarize the git log with statistics per author, date distribution, and change metrics.
 
 Use when: You need to analyze recent activity, understand contribution patterns, or generate reports.
 Prefer over: Parsing log() output manually.
 
+Parameters:
+- layout: "rows" (default) for one dict per commit, or "columns" for one list per field
+  (hash, author, date, message, files_changed, insertions, deletions); more compact for large counts.
+- include_changes: Set to False to skip per-commit change counts and read commit headers only (much faster on long histories).
+
 Returns:
-- commits: List of commit details with changes
+- commits: List of commit details with changes (or per-field lists with layout="columns")
 - stats: Aggregated metrics (total_commits, authors with counts, date_distribution)
 
-Example: summarize_log(count=20) for last 20 commits with stats""")
-def fastfs_summarize_log(count: int = 10, options: str = "") -> Dict[str, Any]:
+Example: summarize_log(count=20) for last 20 commits with stats, summarize_log(count=500, layout="columns"), summarize_log(count=2000, include_changes=False)""")
+async def fastfs_summarize_log(count: int = 10, options: str = "", layout: str = "rows",
+                               include_changes: bool = True) -> Dict[str, Any]:
     """Summarize the git log with useful statistics."""
-    return git_summarize_log(count, options)
+    return await _run_git_tool(git_summarize_log, count, options, layout, include_changes)
 
 @mcp.tool(description="""Analyze staged changes and suggest a conventional commit message.
 
@@ -1301,9 +1756,9 @@ Returns:
 - suggested_scope: Inferred scope from directory structure
 
 Example: suggest_commit() after staging changes with add()""")
-def fastfs_suggest_commit(options: str = "") -> Dict[str, Any]:
+async def fastfs_suggest_commit(options: str = "") -> Dict[str, Any]:
     """Analyze changes and suggest a commit message."""
-    return git_suggest_commit(options)
+    return await _run_git_tool(git_suggest_commit, options)
 
 @mcp.tool(description="""Audit repository history for security issues and problematic patterns.
 
@@ -1320,28 +1775,95 @@ Checks for:
 
 Returns: {issues: [], warnings: [], info: [], stats: {}}
 Example: audit_history() for full security audit""")
-def fastfs_audit_history(options: str = "") -> Dict[str, Any]:
+async def fastfs_audit_history(options: str = "") -> Dict[str, Any]:
     """Audit repository history for potential issues."""
-    return git_audit_history(options)
+    return await _run_git_tool(git_audit_history, options)
+
+# Read-only git tools that can be combined in a single batch() call
+_BATCH_TOOLS = {
+    "status": git_status,
+    "log": git_log,
+    "show": git_show,
+    "diff": git_diff,
+    "rev_parse": git_rev_parse,
+    "ls_files": git_ls_files,
+    "describe": git_describe,
+    "blame": git_blame,
+    "git_grep": git_grep,
+    "context": git_context,
+    "head": git_head,
+    "validate": git_validate,
+    "repo_info": git_repo_info,
+    "summarize_log": git_summarize_log,
+    "suggest_commit": git_suggest_commit,
+}
+_BATCH_MAX = int(os.environ.get("FASTFS_BATCH_MAX", "50"))
+_BATCH_CONCURRENCY = int(os.environ.get("FASTFS_BATCH_CONCURRENCY", "2"))
+
+@mcp.tool(
+    description="""Run several read-only Git queries in one call.
+
+Use when: You need several pieces of repository information at once (e.g. status + log + diff when refreshing your view of a repo).
+Prefer over: Separate status()/log()/diff() calls - one round trip, queries run concurrently.
+
+Parameters:
+- operations: List of {"tool": name, "args": {...}} objects. Supported tools: status, log, show, diff, rev_parse, ls_files, describe, blame, git_grep, context, head, validate, repo_info, summarize_log, suggest_commit
+
+Returns: List of results in the same order as operations. A failed operation yields {"error": "..."}.
+Example: batch([{"tool": "status"}, {"tool": "log", "args": {"options": "--oneline -n 5"}}])""",
+    annotations={"readOnlyHint": True, "openWorldHint": False}
+)
+async def fastfs_batch(operations: List[Dict[str, Any]]) -> List[Any]:
+    """Run several read-only Git queries concurrently."""
+    if len(operations) > _BATCH_MAX:
+        return [{"error": f"Too many operations ({len(operations)}); the maximum per batch is {_BATCH_MAX}"}]
+    
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+    
+    async def run_operation(operation: Dict[str, Any]) -> Any:
+        name = operation.get("tool")
+        func = _BATCH_TOOLS.get(name)
+        if func is None:
+            return {"error": f"Unsupported batch tool '{name}'. Supported: {', '.join(_BATCH_TOOLS)}"}
+        async with semaphore, _git_tool_slot():
+            try:
+                return await loop.run_in_executor(
+                    _git_tool_executor, functools.partial(func, **operation.get("args", {}))
+                )
+            except TypeError as e:
+                return {"error": f"Invalid arguments for '{name}': {str(e)}"}
+            except Exception as e:
+                # One failing query must not fail the rest of the batch
+                print(f"[ERROR] batch operation '{name}' failed: {str(e)}", file=sys.stderr)
+                return {"error": f"'{name}' failed: {str(e)}"}
+    
+    return list(await asyncio.gather(*(run_operation(op) for op in operations)))
 
 if __name__ == "__main__":
     try:
         # Register signal handlers for graceful shutdown
         def handle_signal(signum, frame):
-            print(f"[fastfs-mcp] Received signal {signum}, shutting down...", file=sys.stderr, flush=True)
+            print(f"[fastfs-mcp] Received signal {signum}, shutting down...", file=sys.stderr)
+            sys.stderr.flush()
             sys.exit(0)
             
         signal.signal(signal.SIGINT, handle_signal)
         signal.signal(signal.SIGTERM, handle_signal)
         
+        # Optionally prime the workspace repository's caches in the background
+        # so the first Git tool call doesn't pay the cold-start cost
+        if os.environ.get("FASTFS_WARMUP") == "1":
+            _git_tool_executor.submit(warm_up_repository)
+        
         # Run MCP server
-        print("[fastfs-mcp] Server running, waiting for requests...", file=sys.stderr, flush=True)
+        print("[fastfs-mcp] Server running, waiting for requests...", file=sys.stderr)
         
         # Start the server using the run method (which we now know works)
         mcp.run()
         
     except Exception as e:
-        print(f"[fastfs-mcp] Fatal error: {str(e)}", file=sys.stderr, flush=True)
+        print(f"[fastfs-mcp] Fatal error: {str(e)}", file=sys.stderr)
         import traceback
         traceback.print_exc(file=sys.stderr)
         sys.exit(1)